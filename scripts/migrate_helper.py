@@ -4,21 +4,196 @@ MigrateHelper - A helper class for Docker image migration tasks.
 Helps with extracting and transforming Docker images in compose files.
 """
 
+import codecs
+import functools
+import hashlib
+import json
 import os
 import re
+import shutil
+import string
 import yaml
-from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Dict, Optional, Tuple
 from pathlib import Path
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Validate image names with the linear-time RE2 engine when it is installed
+try:
+    import re2 as _image_re
+except ImportError:
+    _image_re = re
+
+_RESOLVER = yaml.resolver.Resolver()
+_STR_TAG = 'tag:yaml.org,2002:str'
+_NULL_TAG = 'tag:yaml.org,2002:null'
+
+
+class _FullLoad(Exception):
+    """Raised by the event scanner for documents it does not model."""
+
+
+def _check_event(event) -> None:
+    """
+    Hand the document to the full loader on anything the scanner does not resolve.
+    Aliases and anchors (AliasEvent carries its name in anchor too) can be undefined
+    or duplicated, and unknown tags would make the safe loader fail, so let it report them.
+    """
+    if getattr(event, 'anchor', None) is not None or getattr(event, 'tag', None) not in (None, '!'):
+        raise _FullLoad
+
+
+def _scalar_tag(event) -> str:
+    """Resolve the tag of a scalar event the same way the safe loader does."""
+    _check_event(event)
+    return _RESOLVER.resolve(yaml.ScalarNode, event.value, event.implicit)
+
+
+def _is_mapping(event) -> bool:
+    """Check whether a node starts a plain mapping."""
+    _check_event(event)
+    return isinstance(event, yaml.MappingStartEvent)
+
+
+def _skip_node(events, event) -> None:
+    """Consume the node that starts with event without constructing it."""
+    depth = 0
+    while True:
+        _check_event(event)
+        if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            depth += 1
+        elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            depth -= 1
+        if not depth:
+            return
+        event = next(events)
+
+
+def _mapping_items(events):
+    """
+    Yield (key, first value event) pairs of a mapping whose start event was consumed.
+    The caller must consume each value node before asking for the next pair.
+    """
+    for event in events:
+        if isinstance(event, yaml.MappingEndEvent):
+            return
+        if not isinstance(event, yaml.ScalarEvent):  # alias or collection used as a key
+            raise _FullLoad
+        # Merge keys, and non-string keys that the loader may fold together
+        # (e.g. 1 and 1.0, true and yes), need the full loader
+        if _scalar_tag(event) != _STR_TAG:
+            raise _FullLoad
+        yield event.value, next(events)
+
+
+def _image_value(event) -> Optional[str]:
+    """Return the string of an image value, or None when it is empty."""
+    if isinstance(event, yaml.ScalarEvent):
+        tag = _scalar_tag(event)
+        if tag == _STR_TAG:
+            return event.value or None
+        if tag == _NULL_TAG:
+            return None
+    raise _FullLoad
+
+
+def _service_images(events, event) -> List[str]:
+    """Return the 'image' and 'build.image' values of a service node."""
+    if not _is_mapping(event):
+        _skip_node(events, event)
+        return []
+
+    image = build_image = None
+    for key, value in _mapping_items(events):
+        if key == 'image':
+            image = _image_value(value)
+        elif key == 'build':
+            build_image = None
+            if not _is_mapping(value):
+                _skip_node(events, value)
+                continue
+            for build_key, build_value in _mapping_items(events):
+                if build_key == 'image':
+                    build_image = _image_value(build_value)
+                else:
+                    _skip_node(events, build_value)
+        else:
+            _skip_node(events, value)
+    return [image for image in (image, build_image) if image]
+
+
+def _scan_images(data: bytes) -> List[str]:
+    """
+    Collect service image strings from the parser event stream, without
+    constructing the document. Only the image scalars are looked at, all
+    other fields (ports, environment, volumes, ...) are skipped.
+    
+    Raises _FullLoad for documents that need the full loader to be read
+    correctly: aliases or anchors anywhere, merge keys, explicit tags,
+    non-string keys, several documents or a root that is not a mapping.
+    """
+    events = yaml.parse(data, Loader=Loader)
+    next(events)  # StreamStartEvent
+    if not isinstance(next(events), yaml.DocumentStartEvent) or not _is_mapping(next(events)):
+        raise _FullLoad
+
+    # Handle both v1 and v2+ compose file formats: top-level entries are
+    # services unless there is a 'services' key
+    top_level = {}
+    services = None
+    has_services = False
+    for key, value in _mapping_items(events):
+        if key == 'services':
+            if has_services:
+                raise _FullLoad
+            has_services = True
+            if _is_mapping(value):
+                services = {name: _service_images(events, service) for name, service in _mapping_items(events)}
+            else:
+                _skip_node(events, value)
+        else:
+            top_level[key] = _service_images(events, value)
+
+    next(events)  # DocumentEndEvent
+    if not isinstance(next(events), yaml.StreamEndEvent):
+        raise _FullLoad
+
+    if not has_services:
+        services = top_level
+    elif services is None:
+        raise ValueError("Invalid compose file format")
+    return [image for images in services.values() for image in images]
+
 
 class MigrateHelper:
     """Helper class for Docker image migration tasks."""
 
     DEFAULT_TARGET_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'target-images.txt')
 
-    def __init__(self):
-        self.image_pattern = re.compile(r'^[a-z0-9]+(?:[._-][a-z0-9]+)*(?:/[a-z0-9]+(?:[._-][a-z0-9]+)*)*(?::[a-z0-9]+(?:[._-][a-z0-9]+)*)?$')
-        self.target_images = set()
+    # Alphanumeric runs joined by single '.', '_', '-' or '/', plus an optional ':tag'
+    IMAGE_PATTERN = _image_re.compile(r'[a-z0-9]+(?:[._/-][a-z0-9]+)*(?::[a-z0-9]+(?:[._-][a-z0-9]+)*)?')
+    # This pattern matches both 'image: xxx' and 'image: "xxx"' or "image: 'xxx'"
+    IMAGE_LINE_PATTERN = re.compile(r'image:\s*["\']?([^"\'\n\r]+)["\']?')
+
+    # Characters allowed in an image reference when migrating without validation. Anything
+    # else (placeholders, digests, YAML aliases, block scalars, '~', comments) is left alone
+    IMAGE_REFERENCE_CHARS = frozenset(string.ascii_letters + string.digits + '._/:-')
+
+    DEFAULT_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                                     'docker-image-mover')
+    # Bump whenever extract_images results can change for the same file (pattern, scanner, ...)
+    CACHE_VERSION = 1
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: Optional directory for caching extract_images results, keyed by
+                       file path and invalidated when the file's mtime or size changes
+        """
+        self.target_images = frozenset()
+        self.cache_dir = cache_dir
 
     def load_target_images(self, target_file: str) -> None:
         """
@@ -27,47 +202,55 @@ class MigrateHelper:
         Args:
             target_file: Path to the target images configuration file
         """
-        if not os.path.exists(target_file):
-            raise FileNotFoundError(f"Target images file not found: {target_file}")
-            
-        self.target_images.clear()
-        with open(target_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-                # Add image to target set
-                if self._is_valid_image(line):
-                    self.target_images.add(line)
-                    # Also add version without tag for matching
-                    base_image = line.split(':')[0]
-                    self.target_images.add(base_image)
-
-    def _is_valid_image(self, image: str) -> bool:
+        try:
+            content = Path(target_file).read_text()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Target images file not found: {target_file}") from None
+
+        lines = (line.strip() for line in content.splitlines())
+        # Skip empty lines and comments
+        images = {line for line in lines if line and not line.startswith('#') and self._is_valid_image(line)}
+        # Also add version without tag for matching
+        self.target_images = frozenset(images | {image.partition(':')[0] for image in images})
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _is_valid_image(image: str) -> bool:
         """Check if the string is a valid docker image name."""
-        return bool(self.image_pattern.match(image.lower()))
+        return MigrateHelper.IMAGE_PATTERN.fullmatch(image.lower()) is not None
 
-    def _extract_image_name(self, image: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _extract_image_name(image: str) -> str:
         """Extract the last part of the image name."""
-        # Split by ':' first to separate tag
-        name_parts = image.split(':')[0]
-        # Get the last part after '/'
-        return name_parts.split('/')[-1]
+        # Drop the tag, then keep the part after the last '/'
+        return image.partition(':')[0].rpartition('/')[2]
 
-    def _transform_image(self, image: str, new_registry: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _transform_image(image: str, new_registry: str) -> str:
         """Transform image name according to migration rules."""
         if not image:
             return image
             
         # Split image name and tag
-        parts = image.split(':')
-        image_name = self._extract_image_name(parts[0])
-        tag = parts[1] if len(parts) > 1 else 'latest'
+        name_part, _, tag = image.partition(':')
+        image_name = MigrateHelper._extract_image_name(name_part)
+        tag = tag or 'latest'
         
         # Create new image name
         return f"{new_registry}/{image_name}:{tag}"
 
+    @staticmethod
+    def _is_plain_reference(image: str) -> bool:
+        """Cheap guard used instead of full validation when migrating without validation."""
+        # Only image reference characters, starting with a letter or digit
+        if not image[:1].isalnum() or not MigrateHelper.IMAGE_REFERENCE_CHARS.issuperset(image):
+            return False
+        # A second ':' or a '/' after the first one means a registry port (host:5000/app)
+        tag = image.partition(':')[2]
+        return ':' not in tag and '/' not in tag
+
     def _should_migrate_image(self, image: str) -> bool:
         """
         Check if an image should be migrated based on target images.
@@ -78,12 +261,10 @@ class MigrateHelper:
         Returns:
             True if image should be migrated, False otherwise
         """
-        if not self.target_images:  # If no target images loaded, migrate all
-            return True
-            
-        # Check both full image name and base name without tag
-        base_image = image.split(':')[0]
-        return image in self.target_images or base_image in self.target_images
+        targets = self.target_images
+        # If no target images loaded, migrate all. Otherwise check both
+        # full image name and base name without tag
+        return not targets or image in targets or image.partition(':')[0] in targets
 
     def extract_images(self, yaml_file: str) -> List[str]:
         """
@@ -95,16 +276,79 @@ class MigrateHelper:
         Returns:
             List of image names in alphabetical order
         """
-        if not os.path.exists(yaml_file):
-            raise FileNotFoundError(f"File not found: {yaml_file}")
-            
-        with open(yaml_file, 'r') as f:
+        try:
+            f = open(yaml_file, 'rb')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {yaml_file}") from None
+
+        with f:
+            if not self.cache_dir:
+                return self._extract_from_bytes(f.read())
+
+            stat = os.fstat(f.fileno())
+            cache_file = self._cache_file(yaml_file)
+            images = self._read_cache(cache_file, stat)
+            if images is None:
+                images = self._extract_from_bytes(f.read())
+                self._write_cache(cache_file, stat, images)
+            return images
+
+    def _extract_from_bytes(self, data: bytes) -> List[str]:
+        """Extract the sorted, valid image names from the raw content of a YAML file."""
+        # Without an 'image' key anywhere there is nothing to extract, so skip parsing.
+        # UTF-16 files are left to the loader, the byte scan only holds for UTF-8.
+        if b'image' not in data and not data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return []
+
+        try:
             try:
-                compose_data = yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                raise ValueError(f"Invalid YAML file: {e}")
+                candidates = _scan_images(data)
+            except _FullLoad:
+                candidates = self._collect_images(yaml.load(data, Loader=Loader))
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML file: {e}")
+
+        is_valid = self._is_valid_image
+        return sorted({image for image in candidates if is_valid(image)})
+
+    def _cache_file(self, yaml_file: str) -> str:
+        """Get the cache entry path for a YAML file."""
+        digest = hashlib.blake2b(os.path.abspath(yaml_file).encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
 
-        images = set()
+    @staticmethod
+    def _read_cache(cache_file: str, stat: os.stat_result) -> Optional[List[str]]:
+        """Return the cached images if the entry is current and matches the file's mtime and size."""
+        try:
+            with open(cache_file, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (not isinstance(entry, dict) or entry.get('version') != MigrateHelper.CACHE_VERSION
+                or entry.get('mtime_ns') != stat.st_mtime_ns or entry.get('size') != stat.st_size):
+            return None
+        images = entry.get('images')
+        if not isinstance(images, list) or not all(isinstance(image, str) for image in images):
+            return None
+        return images
+
+    def _write_cache(self, cache_file: str, stat: os.stat_result, images: List[str]) -> None:
+        """Store extracted images in the cache. Failures only cost a re-parse next time."""
+        entry = {'version': self.CACHE_VERSION, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size,
+                 'images': images}
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump(entry, f)
+            # Atomic rename, so concurrent runs never see a partial entry
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+
+    def _collect_images(self, compose_data) -> List[str]:
+        """Collect image strings from a fully loaded compose document."""
+        images = []
         
         # Handle both v1 and v2+ compose file formats
         services = compose_data.get('services', compose_data)
@@ -113,24 +357,23 @@ class MigrateHelper:
             raise ValueError("Invalid compose file format")
             
         for service in services.values():
-            if isinstance(service, dict):
-                # Get image from 'image' field
-                if 'image' in service and service['image']:
-                    image = service['image']
-                    if self._is_valid_image(image):
-                        images.add(image)
-                
-                # Check build context for image name
-                if 'build' in service:
-                    build = service['build']
-                    if isinstance(build, dict) and 'image' in build:
-                        image = build['image']
-                        if self._is_valid_image(image):
-                            images.add(image)
-
-        return sorted(list(images))
-
-    def migrate(self, yaml_file: str, new_registry: str, output_file: Optional[str] = None) -> str:
+            if not isinstance(service, dict):
+                continue
+            # Get image from 'image' field
+            image = service.get('image')
+            if image:
+                images.append(image)
+            # Check build context for image name
+            build = service.get('build')
+            if isinstance(build, dict):
+                image = build.get('image')
+                if image:
+                    images.append(image)
+
+        return images
+
+    def migrate(self, yaml_file: str, new_registry: str, output_file: Optional[str] = None,
+                validate: bool = True) -> Tuple[str, bool]:
         """
         Migrate images in a YAML file to use new registry.
         Uses string-based migration to handle non-standard YAML templates.
@@ -139,30 +382,54 @@ class MigrateHelper:
             yaml_file: Path to the input YAML file
             new_registry: New registry base URL
             output_file: Optional path for output file. If not provided, will add suffix to input file
+            validate: Only rewrite values that are valid image names. When disabled, only a cheap
+                      guard runs: values must start with a letter or digit, contain only letters,
+                      digits and '._/:-', and have no registry port ('host:5000/app'). This still
+                      leaves placeholders, digests, aliases, '~' and block scalars alone, but
+                      rewrites some names full validation rejects (e.g. uppercase or '__')
             
         Returns:
-            Path to the output file
+            Tuple of the output file path and whether any image was rewritten. When nothing
+            was rewritten and output_file is not provided, nothing is written and yaml_file
+            itself is returned; with output_file, the input is copied there unchanged
         """
-        if not os.path.exists(yaml_file):
-            raise FileNotFoundError(f"File not found: {yaml_file}")
-
         # Read the original file content
-        with open(yaml_file, 'r') as f:
-            content = f.read()
+        try:
+            with open(yaml_file, 'r') as f:
+                content = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {yaml_file}") from None
+
+        # Bind the helpers once instead of looking them up on self for every match
+        should_migrate = self._should_migrate_image
+        is_valid = self._is_valid_image
+        is_plain = self._is_plain_reference
+        transform = self._transform_image
+
+        mutated = False
 
-        # Find all image definitions in the content
-        # This pattern matches both 'image: xxx' and 'image: "xxx"' or "image: 'xxx'"
-        image_pattern = re.compile(r'image:\s*["\']?([^"\'\n\r]+)["\']?')
-        
         def replace_image(match):
+            nonlocal mutated
             image = match.group(1).strip()
-            if self._is_valid_image(image) and self._should_migrate_image(image):
-                new_image = self._transform_image(image, new_registry)
-                return f'image: {new_image}'
+            # The target lookup is a set check, so run it before the regex validation
+            if should_migrate(image) and (is_valid(image) if validate else is_plain(image)):
+                replacement = f'image: {transform(image, new_registry)}'
+                mutated = mutated or replacement != match.group(0)
+                return replacement
             return match.group(0)
 
         # Replace all image definitions
-        new_content = image_pattern.sub(replace_image, content)
+        new_content = self.IMAGE_LINE_PATTERN.sub(replace_image, content)
+
+        if not mutated:
+            if not output_file:
+                return yaml_file, False
+            # Copy the original bytes verbatim rather than rewriting the decoded text
+            try:
+                shutil.copyfile(yaml_file, output_file)
+            except shutil.SameFileError:
+                pass
+            return output_file, False
 
         # Generate output file path if not provided
         if not output_file:
@@ -173,7 +440,62 @@ class MigrateHelper:
         with open(output_file, 'w') as f:
             f.write(new_content)
 
-        return output_file
+        return output_file, True
+
+    def migrate_many(self, files: Iterable[str], new_registry: str, output_dir: Optional[str] = None,
+                     workers: Optional[int] = None, validate: bool = True,
+                     root: Optional[str] = None) -> List[Tuple[str, bool]]:
+        """
+        Migrate images in several YAML files in parallel worker processes.
+        
+        Args:
+            files: Paths to the input YAML files
+            new_registry: New registry base URL
+            output_dir: Optional directory for output files. Each output keeps its input's path
+                        relative to root, or just its file name when root is not provided.
+                        If not provided, each output is written next to its input file,
+                        and files without images to migrate are left as they are
+            workers: Number of worker processes. Defaults to the number of CPUs
+            validate: Only rewrite values that are valid image names, see migrate
+            root: Optional directory the input files were collected from, see output_dir
+            
+        Returns:
+            (output path, rewritten) tuples as returned by migrate, in the same order as
+            the input files
+        """
+        files = list(files)
+        if not files:
+            return []
+
+        if output_dir:
+            if root:
+                names = [os.path.relpath(yaml_file, root) for yaml_file in files]
+                for yaml_file, name in zip(files, names):
+                    if name == os.pardir or name.startswith(os.pardir + os.sep):
+                        raise ValueError(f"Input file is not under {root}: {yaml_file}")
+            else:
+                names = [os.path.basename(yaml_file) for yaml_file in files]
+            output_files = [os.path.join(output_dir, name) for name in names]
+            if len(set(output_files)) != len(output_files):
+                raise ValueError(f"Input files with the same name cannot share output directory: {output_dir}. "
+                                 f"Pass root to keep their relative paths")
+            for directory in {os.path.dirname(output_file) for output_file in output_files}:
+                os.makedirs(directory, exist_ok=True)
+        else:
+            output_files = [None] * len(files)
+
+        tasks = [(yaml_file, new_registry, output_file, self.target_images, validate)
+                 for yaml_file, output_file in zip(files, output_files)]
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            return list(pool.map(_migrate_one, tasks))
+
+
+def _migrate_one(task) -> Tuple[str, bool]:
+    """Migrate a single file in a worker process, see MigrateHelper.migrate_many."""
+    yaml_file, new_registry, output_file, target_images, validate = task
+    helper = MigrateHelper()
+    helper.target_images = target_images
+    return helper.migrate(yaml_file, new_registry, output_file, validate=validate)
 
 
 if __name__ == '__main__':
@@ -182,15 +504,26 @@ if __name__ == '__main__':
     
     parser = argparse.ArgumentParser(description='Docker Compose Migration Helper')
     parser.add_argument('command', choices=['extract', 'migrate'], help='Command to execute')
-    parser.add_argument('yaml_file', help='Path to the YAML file')
+    parser.add_argument('yaml_file', help='Path to the YAML file, or a directory to search with --glob')
     parser.add_argument('--registry', help='New registry base URL (required for migrate)', default=None)
-    parser.add_argument('--output', help='Output file path (optional for migrate)', default=None)
+    parser.add_argument('--output', help='Output file path, or output directory when yaml_file is a directory '
+                                         '(optional for migrate)', default=None)
+    parser.add_argument('--glob', help='File pattern used when yaml_file is a directory (default: %(default)s)',
+                       default='**/docker-compose*.yml')
+    parser.add_argument('--jobs', type=int, help='Number of worker processes when migrating a directory '
+                                                 '(default: number of CPUs)', default=os.cpu_count())
     parser.add_argument('--target', help='Target images configuration file (default: config/target-images.txt)', 
                        default=MigrateHelper.DEFAULT_TARGET_FILE)
+    parser.add_argument('--cache', action='store_true',
+                       help=f'Cache extracted images per file in {MigrateHelper.DEFAULT_CACHE_DIR} (extract only)')
+    parser.add_argument('--no-validate', dest='validate', action='store_false',
+                       help='Skip image name validation, only leaving out values with characters other than '
+                            'letters, digits and ._/:- (placeholders, digests, YAML aliases, block scalars) '
+                            'or with registry ports (migrate only)')
     
     args = parser.parse_args()
     
-    helper = MigrateHelper()
+    helper = MigrateHelper(cache_dir=MigrateHelper.DEFAULT_CACHE_DIR if args.cache else None)
     
     # Always try to load target images file
     try:
@@ -198,15 +531,54 @@ if __name__ == '__main__':
     except FileNotFoundError as e:
         print(f"Warning: {e}. Will migrate all images.", file=sys.stderr)
     
+    if os.path.isdir(args.yaml_file):
+        input_dir = Path(args.yaml_file).resolve()
+        output_dir = Path(args.output).resolve() if args.command == 'migrate' and args.output else None
+        if output_dir and (output_dir == input_dir or output_dir in input_dir.parents):
+            parser.error("--output must not contain the input directory")
+        # Skip outputs of earlier runs, they match the default pattern too: either
+        # .migrated files next to their inputs, or anything inside an --output
+        # directory nested in the searched one
+        files = sorted(str(path) for path in Path(args.yaml_file).glob(args.glob)
+                       if path.is_file() and not path.stem.endswith('.migrated')
+                       and not (output_dir and output_dir in path.resolve().parents))
+        if not files:
+            print(f"Warning: No files matching {args.glob} in {args.yaml_file}", file=sys.stderr)
+    else:
+        files = None
+    
     try:
         if args.command == 'extract':
-            images = helper.extract_images(args.yaml_file)
+            if files is None:
+                images = helper.extract_images(args.yaml_file)
+            else:
+                images = sorted({image for yaml_file in files for image in helper.extract_images(yaml_file)})
             print('\n'.join(images))
         else:  # migrate
             if not args.registry:
                 parser.error("--registry is required for migrate command")
-            output = helper.migrate(args.yaml_file, args.registry, args.output)
-            print(f"Migration complete. Output written to: {output}")
+            if files is None:
+                output, rewritten = helper.migrate(args.yaml_file, args.registry, args.output,
+                                                   validate=args.validate)
+                if rewritten:
+                    print(f"Migration complete. Output written to: {output}")
+                elif output == args.yaml_file:
+                    print(f"No images to migrate. {output} left unchanged.")
+                else:
+                    print(f"No images to migrate. Copied unchanged to: {output}")
+            else:
+                outputs = helper.migrate_many(files, args.registry, args.output, workers=args.jobs,
+                                              validate=args.validate, root=args.yaml_file)
+                migrated = 0
+                for yaml_file, (output, rewritten) in zip(files, outputs):
+                    if rewritten:
+                        print(f"Output written to: {output}")
+                        migrated += 1
+                    elif output == yaml_file:
+                        print(f"Unchanged: {yaml_file}")
+                    else:
+                        print(f"Unchanged, copied to: {output}")
+                print(f"Migration complete. {migrated} of {len(outputs)} file(s) migrated.")
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
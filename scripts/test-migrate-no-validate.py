@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Check that MigrateHelper.migrate without validation only rewrites plain image
+references and leaves YAML syntax, placeholders and registry ports untouched.
+
+Usage: python scripts/test-migrate-no-validate.py
+"""
+
+import os
+import sys
+import tempfile
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from migrate_helper import MigrateHelper  # noqa: E402
+
+REGISTRY = 'reg'
+
+# name: (service definition, expected 'image' value after migration)
+CASES = {
+    'plain tag': ("image: nginx:1.2", 'reg/nginx:1.2'),
+    'no tag': ("image: org/redis", 'reg/redis:latest'),
+    'alias': ("image: *img", 'nginx:1.2'),
+    'anchor': ("image: &other postgres:15", 'postgres:15'),
+    'null': ("image: ~", None),
+    'folded block scalar': ("image: >-\n      redis", 'redis'),
+    'literal block scalar': ("image: |\n      redis", 'redis\n'),
+    'registry port with tag': ("image: localhost:5000/app:1", 'localhost:5000/app:1'),
+    'registry port without tag': ("image: localhost:5000/app", 'localhost:5000/app'),
+    'digest': ("image: nginx@sha256:abcd", 'nginx@sha256:abcd'),
+    'placeholder': ("image: ${APP_IMAGE}", '${APP_IMAGE}'),
+    'template': ("image: \"{{ app_image }}\"", '{{ app_image }}'),
+}
+
+
+def build_compose():
+    """Build one compose file with a service per case, plus an anchor the alias case refers to."""
+    lines = ['x-image: &img nginx:1.2', 'services:']
+    for index, (definition, _) in enumerate(CASES.values()):
+        lines += [f'  s{index}:', f'    {definition}']
+    return '\n'.join(lines) + '\n'
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    source = os.path.join(tmp, 'docker-compose.yml')
+    with open(source, 'w') as f:
+        f.write(build_compose())
+    output, _ = MigrateHelper().migrate(source, REGISTRY, os.path.join(tmp, 'out.yml'), validate=False)
+    with open(output) as f:
+        try:
+            services = yaml.safe_load(f)['services']
+        except yaml.YAMLError as e:
+            print(f"FAIL  migrated file is not valid YAML: {e}")
+            sys.exit(1)
+
+failed = 0
+for index, (name, (_, expected)) in enumerate(CASES.items()):
+    actual = services[f's{index}']['image']
+    if actual == expected:
+        print(f"ok    {name}: {actual!r}")
+    else:
+        print(f"FAIL  {name}: expected {expected!r}, got {actual!r}")
+        failed += 1
+
+print("---")
+print(f"{len(CASES) - failed}/{len(CASES)} cases match")
+sys.exit(1 if failed else 0)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Check that the event scanner used by MigrateHelper.extract_images gives the
+same result as loading the whole document, on the edge cases it has to handle.
+
+Usage: python scripts/test-scan-images.py
+"""
+
+import os
+import sys
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from migrate_helper import Loader, MigrateHelper, _FullLoad, _scan_images  # noqa: E402
+
+CASES = {
+    'v2 layout': "services:\n  web:\n    image: nginx:alpine\n    ports: ['80:80']\n"
+                 "  app:\n    build:\n      context: .\n      image: my/app:1.0\n",
+    'v1 layout': "web:\n  image: nginx\ndb:\n  image: redis:7\nversion: '2'\n",
+    'top-level image with services': "image: top\nservices:\n  a:\n    image: nginx\n",
+    'quoted and flow values': "services:\n  a:\n    image: 'quoted:1'\n  b:\n    image: \"dq/x\"\n  c: {image: flow}\n",
+    'alias service': "x-base: &b\n  image: nginx\nservices:\n  a: *b\n",
+    'alias image': "services:\n  a:\n    image: &i nginx\n  b:\n    image: *i\n",
+    'merge key alias': "x-base: &b\n  image: nginx\nservices:\n  a:\n    <<: *b\n",
+    'merge key inline': "services:\n  a:\n    <<: {image: nginx}\n",
+    'explicit str tag': "services:\n  a:\n    image: !!str nginx\n",
+    'unknown tag elsewhere': "services:\n  a:\n    environment: !custom x\n    image: nginx\n",
+    'duplicate image key': "services:\n  a:\n    image: nginx\n    image: redis\n",
+    'duplicate service': "services:\n  a:\n    image: nginx\n  a:\n    image: redis\n",
+    'duplicate build': "services:\n  a:\n    build:\n      image: my/app\n    build: .\n",
+    'duplicate int keys': "1: {image: a}\n1.0: {image: b}\n",
+    'duplicate bool keys': "true: {image: a}\nyes: {image: b}\n",
+    'int and str keys': "1: {image: one}\n'1': {image: two}\n",
+    'null and empty images': "services:\n  a:\n    image: ~\n  b:\n    image: ''\n  c:\n    build:\n      image:\n",
+    'non-string image': "services:\n  a:\n    image: true\n",
+    'uppercase image': "services:\n  a:\n    image: NGINX:Latest\n",
+    'complex key': "services:\n  ? [a, b]\n  : image: x\n",
+    'services null': "services: null\n",
+    'services list': "services: []\n",
+    'explicit document markers': "--- \nservices:\n  a:\n    image: nginx\n...\n",
+    'several documents': "services:\n  a:\n    image: nginx\n---\nfoo: 1\n",
+    'undefined alias in skipped field': "services:\n  a:\n    image: nginx\n    environment: *nope\n",
+    'duplicate anchor': "x: &a 1\ny: &a 2\nservices:\n  a: {image: nginx}\n",
+    'anchor without alias': "x-env: &env {A: b}\nservices:\n  a:\n    image: nginx\n",
+    'invalid yaml': "services:\n  a:\n    image: nginx\n  bad: [\n",
+}
+
+
+def outcome(extract, data):
+    """Run one extraction path and reduce its result or error to a comparable value."""
+    try:
+        return sorted(image for image in extract(data) if MigrateHelper._is_valid_image(image))
+    except yaml.YAMLError:
+        return 'YAMLError'
+    except Exception as e:
+        return type(e).__name__
+
+
+def full_load(data):
+    return MigrateHelper()._collect_images(yaml.load(data, Loader=Loader))
+
+
+def scan(data):
+    try:
+        return _scan_images(data)
+    except _FullLoad:
+        return full_load(data)
+
+
+failed = 0
+for name, text in CASES.items():
+    data = text.encode()
+    expected, actual = outcome(full_load, data), outcome(scan, data)
+    if expected == actual:
+        print(f"ok    {name}: {actual}")
+    else:
+        print(f"FAIL  {name}: full load {expected}, scanner {actual}")
+        failed += 1
+
+print("---")
+print(f"{len(CASES) - failed}/{len(CASES)} cases match")
+sys.exit(1 if failed else 0)